@@ -1,25 +1,43 @@
 #!/usr/bin/env python3
 import asyncio
-import subprocess
-from dataclasses import dataclass
+import functools
+import json
+import os
+import re
+import shutil
+import signal
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Input, Label, RichLog, Static, Tree
+from textual.widgets.tree import TreeNode
 
+# A few hundred of these are built on every refresh; skip the per-instance
+# __dict__ where the interpreter supports it.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Project:
     name: str
     path: Path
-    worktrees: List[str]
+    worktrees: Tuple[str, ...]
     is_worktree_repo: bool
 
 
-@dataclass
+# Frozen, so nodes can be matched by value when the tree is patched.
+@dataclass(frozen=True, **_SLOTS)
 class NodeData:
     kind: str  # "project" | "worktree" | "session" | "new-session"
     repo: str
@@ -28,6 +46,15 @@ class NodeData:
     sub: Optional[str] = None
 
 
+@dataclass(**_SLOTS)
+class TreeEntry:
+    label: str
+    data: NodeData
+    expand: bool = False
+    children: List["TreeEntry"] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=1)
 def projects_dir() -> Path:
     home = Path.home()
     if (home / "Projects").is_dir():
@@ -35,39 +62,292 @@ def projects_dir() -> Path:
     return home / "projects"
 
 
-def run_command(cmd: List[str]) -> str:
+@functools.lru_cache(maxsize=1)
+def _tmux_path() -> Optional[str]:
+    return shutil.which("tmux")
+
+
+class _TTLCache:
+    def __init__(self, ttls: Dict[Tuple[str, ...], float]) -> None:
+        self.ttls = ttls
+        self._entries: Dict[Tuple[str, ...], Tuple[float, str]] = {}
+
+    def cacheable(self, cmd: List[str]) -> bool:
+        return tuple(cmd[:2]) in self.ttls
+
+    def get(self, cmd: List[str]) -> Optional[str]:
+        key = tuple(cmd)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stamp, output = entry
+        if time.monotonic() - stamp >= self.ttls[key[:2]]:
+            del self._entries[key]
+            return None
+        return output
+
+    def put(self, cmd: List[str], output: str) -> None:
+        if self.cacheable(cmd):
+            self._entries[tuple(cmd)] = (time.monotonic(), output)
+
+    def invalidate(self, prefix: Iterable[str] = ()) -> None:
+        prefix = tuple(prefix)
+        for key in [key for key in self._entries if key[: len(prefix)] == prefix]:
+            del self._entries[key]
+
+
+_command_cache = _TTLCache(
+    {
+        ("dev", "pi-status"): 1.0,
+        ("dev", "requirements"): 5.0,
+        ("dev", "queue-status"): 1.0,
+        ("dev", "batch-status"): 1.0,
+        ("dev", "help"): 60.0,
+    }
+)
+
+
+def _remember_output(cmd: List[str], output: str) -> None:
+    if _command_cache.cacheable(cmd):
+        _command_cache.put(cmd, output)
+    else:
+        # Anything else (send, cleanup, ...) may change what dev reports.
+        _command_cache.invalidate(cmd[:1])
+
+
+_Reply = TypeVar("_Reply")
+
+
+class _PipeHelper(ABC, Generic[_Reply]):
+    # A long-lived helper process that answers one request at a time over its
+    # stdin/stdout. A call never queues behind a busy helper (e.g. `dev
+    # send-pi` waiting on the agent); it returns None and the caller spawns
+    # its own process instead.
+    def __init__(self) -> None:
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._busy = False
+
+    async def _spawn(self, cmd: List[str]) -> None:
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=2**24,
+            )
+        except FileNotFoundError:
+            self._proc = None
+
+    async def stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        if proc.stdin:
+            proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            proc.kill()
+
+    async def call(self, args: List[str]) -> Optional[_Reply]:
+        if self._proc is None or self._proc.returncode is not None or self._busy:
+            return None
+        # Claimed before the first await, so callers starting in the same tick
+        # already see the helper as busy.
+        self._busy = True
+        # Shielded so a cancelled caller still consumes its reply and the
+        # request/response stream stays in step.
+        return await asyncio.shield(self._exchange(args))
+
+    async def _exchange(self, args: List[str]) -> Optional[_Reply]:
+        try:
+            proc = self._proc
+            if proc is None or proc.stdin is None or proc.stdout is None:
+                return None
+            try:
+                return await self._request(proc.stdin, proc.stdout, args)
+            except (BrokenPipeError, ConnectionResetError, ValueError):
+                pass
+            # The helper exited or the stream is out of step; shut it down (an
+            # attached tmux client or dev loop would otherwise be orphaned)
+            # and stop using it.
+            await self.stop()
+            return None
+        finally:
+            self._busy = False
+
+    @abstractmethod
+    async def _request(
+        self, stdin: asyncio.StreamWriter, stdout: asyncio.StreamReader, args: List[str]
+    ) -> Optional[_Reply]:
+        ...
+
+
+class DevServer(_PipeHelper[Tuple[int, str]]):
+    # One long-lived `dev --serve` so calls skip a fresh process and script parse.
+    async def start(self) -> None:
+        await self._spawn(["dev", "--serve"])
+
+    async def _request(
+        self, stdin: asyncio.StreamWriter, stdout: asyncio.StreamReader, args: List[str]
+    ) -> Optional[Tuple[int, str]]:
+        # Argument count, then each argument, all NUL-terminated; the reply is
+        # "<code>\n<output>\0".
+        stdin.write(b"".join(field.encode() + b"\0" for field in [str(len(args)), *args]))
+        await stdin.drain()
+        try:
+            # An empty line means dev exited (no --serve); anything that isn't
+            # a number means the stream is out of step. Both raise ValueError.
+            code = int(await stdout.readline())
+            output = await stdout.readuntil(b"\0")
+        except asyncio.IncompleteReadError:
+            raise ConnectionResetError
+        except asyncio.LimitOverrunError:
+            raise ValueError
+        return code, output[:-1].decode("utf-8", "replace")
+
+
+_dev_server = DevServer()
+
+
+async def run_command_result(cmd: List[str]) -> Tuple[int, str]:
+    # Cached output is reported with status 0.
+    cached = _command_cache.get(cmd)
+    if cached is not None:
+        return 0, cached
+    if cmd[:1] == ["dev"]:
+        reply = await _dev_server.call(cmd[1:])
+        if reply is not None:
+            output = reply[1].strip()
+            _remember_output(cmd, output)
+            return reply[0], output
     try:
-        result = subprocess.run(cmd, check=False, capture_output=True, text=True)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
     except FileNotFoundError:
-        return ""
-    output = (result.stdout or "") + (result.stderr or "")
-    return output.strip()
+        return 127, ""
+    try:
+        stdout, stderr = await proc.communicate()
+    except asyncio.CancelledError:
+        proc.kill()
+        raise
+    output = ((stdout or b"") + (stderr or b"")).decode("utf-8", "replace").strip()
+    _remember_output(cmd, output)
+    return proc.returncode or 0, output
 
 
-def load_projects() -> List[Project]:
-    root = projects_dir()
-    projects: List[Project] = []
-    if not root.exists():
-        return projects
-    for entry in sorted(root.iterdir()):
-        if not entry.is_dir():
+async def run_command_async(cmd: List[str]) -> str:
+    return (await run_command_result(cmd))[1]
+
+
+async def gather_commands(commands: List[List[str]], limit: int = 16) -> List[str]:
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(cmd: List[str]) -> str:
+        async with semaphore:
+            return await run_command_async(cmd)
+
+    return list(await asyncio.gather(*(run(cmd) for cmd in commands)))
+
+
+async def batch_status(sessions: List[str]) -> Optional[Dict[str, Dict[str, str]]]:
+    returncode, stdout = await run_command_result(["dev", "batch-status", "--json", "--sessions", *sessions])
+    if returncode != 0:
+        return None
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    for session, entry in data.items():
+        if not isinstance(entry, dict):
             continue
-        if entry.name == "dev":
+        _command_cache.put(["dev", "pi-status", session, "--messages", "1"], entry.get("last_msg", ""))
+        _command_cache.put(["dev", "requirements", session], entry.get("requirements", ""))
+        # The queue is only included when asked for with --queue.
+        if "queue" in entry:
+            _command_cache.put(["dev", "queue-status", session, "-m"], entry["queue"])
+    return data
+
+
+@dataclass
+class ProjectCache:
+    root_mtime: int = -1
+    names: List[str] = field(default_factory=list)
+    projects: Dict[str, Tuple[int, Project]] = field(default_factory=dict)
+
+
+def scan_project(name: str, path: str) -> Project:
+    # Names are interned so every node, session and cache key built from them
+    # shares one object and compares by identity first.
+    name = sys.intern(name)
+    if not os.path.isdir(os.path.join(path, ".bare")):
+        return Project(name, Path(path), (), False)
+    with os.scandir(path) as it:
+        worktrees = [sys.intern(d.name) for d in it if d.is_dir() and d.name != ".bare"]
+    return Project(name, Path(path), tuple(sorted(worktrees)), True)
+
+
+def load_projects(cache: Optional[ProjectCache] = None) -> List[Project]:
+    root = projects_dir()
+    try:
+        root_mtime = os.stat(root).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if cache is not None and cache.root_mtime == root_mtime:
+        # Nothing was added, removed or renamed under the root; skip the listing.
+        names = cache.names
+    else:
+        with os.scandir(root) as it:
+            # DirEntry.is_dir() answers from the dirent type; only symlinks cost a stat.
+            names = sorted(e.name for e in it if e.is_dir() and e.name != "dev")
+    mtimes: Dict[str, int] = {}
+    by_name: Dict[str, Project] = {}
+    stale = []
+    for name in names:
+        path = os.path.join(root, name)
+        # A worktree being added or removed bumps the project directory's mtime.
+        try:
+            mtimes[name] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
             continue
-        bare_dir = entry / ".bare"
-        if bare_dir.is_dir():
-            worktrees = [d.name for d in entry.iterdir() if d.is_dir() and d.name != ".bare"]
-            projects.append(Project(entry.name, entry, sorted(worktrees), True))
+        cached = cache.projects.get(name) if cache is not None else None
+        if cached and cached[0] == mtimes[name]:
+            by_name[name] = cached[1]
         else:
-            projects.append(Project(entry.name, entry, [], False))
+            stale.append((name, path))
+    if len(stale) > 1:
+        # I/O bound (slow disks, network mounts), so threads are enough.
+        workers = min(32, (os.cpu_count() or 1) * 4, len(stale))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            by_name.update(zip((name for name, _ in stale), pool.map(lambda args: scan_project(*args), stale)))
+    else:
+        by_name.update((name, scan_project(name, path)) for name, path in stale)
+    projects = [by_name[name] for name in names if name in by_name]
+    if cache is not None:
+        cache.root_mtime = root_mtime
+        cache.names = names
+        cache.projects = {project.name: (mtimes[project.name], project) for project in projects}
     return projects
 
 
 def summarize_line(output: str) -> str:
-    for line in output.splitlines():
-        line = line.strip()
+    # Walk line by line with find() so only the first non-empty line is
+    # sliced out, rather than splitting the whole output.
+    start = 0
+    while start < len(output):
+        end = output.find("\n", start)
+        if end == -1:
+            end = len(output)
+        line = output[start:end].strip()
         if line:
             return line
+        start = end + 1
     return "(none)"
 
 
@@ -82,84 +362,176 @@ def worktree_session(repo: str, worktree: str) -> str:
 
 
 def normalize_message(message: str) -> str:
-    return " ".join(message.splitlines()).strip()
+    return " ".join(message.split())
 
 
 def tmux_session_name(session: str) -> str:
     return session.replace("/", "_")
 
 
-def tmux_session_exists(session: str) -> bool:
-    import shutil
-
-    if not shutil.which("tmux"):
-        return False
-    tmux_name = tmux_session_name(session)
-    result = subprocess.run(
-        ["tmux", "has-session", "-t", tmux_name],
-        check=False,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    return result.returncode == 0
+def tmux_session_exists(session: str, snapshot: Set[str]) -> bool:
+    return tmux_session_name(session) in snapshot
 
 
-def tmux_window_exists(window_name: str) -> bool:
-    import shutil
+class TmuxControl(_PipeHelper[Tuple[bool, List[str]]]):
+    # One `tmux -C` client attached to our own session; queries go over its
+    # stdin instead of forking a new tmux client each time.
+    async def start(self) -> None:
+        tmux = _tmux_path()
+        # Outside tmux there is no session to attach to; callers spawn instead.
+        if not tmux or not os.environ.get("TMUX"):
+            return
+        cmd = [tmux, "-C", "attach-session", "-f", "no-output,ignore-size"]
+        if os.environ.get("TMUX_PANE"):
+            cmd += ["-t", os.environ["TMUX_PANE"]]
+        # If tmux is too old for these attach flags it exits, and the first
+        # call finds the pipe closed.
+        await self._spawn(cmd)
+
+    async def _request(
+        self, stdin: asyncio.StreamWriter, stdout: asyncio.StreamReader, args: List[str]
+    ) -> Optional[Tuple[bool, List[str]]]:
+        line = " ".join("'" + arg.replace("'", "'\\''") + "'" for arg in args)
+        stdin.write(line.encode() + b"\n")
+        await stdin.drain()
+        return await self._read_block(stdout)
+
+    async def _read_block(self, stdout: asyncio.StreamReader) -> Tuple[bool, List[str]]:
+        # Replies are framed as `%begin <time> <number> <flags>` ... `%end` (or
+        # `%error`) with the same number. Other `%` lines are notifications,
+        # and the attach-session reply itself carries flags 0, not 1.
+        end = None
+        lines: List[str] = []
+        while True:
+            raw = await stdout.readline()
+            if not raw:
+                raise ConnectionResetError
+            text = raw.decode("utf-8", "replace").rstrip("\n")
+            fields = text.split()
+            if end is None:
+                if fields[:1] == ["%begin"] and fields[3:4] == ["1"]:
+                    end = fields[2]
+                continue
+            if fields[:1] in (["%end"], ["%error"]) and fields[2:3] == [end]:
+                return fields[0] == "%end", lines
+            lines.append(text)
 
-    if not shutil.which("tmux"):
-        return False
-    result = subprocess.run(
-        ["tmux", "list-windows", "-F", "#W"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return False
-    names = {line.strip() for line in (result.stdout or "").splitlines() if line.strip()}
-    return window_name in names
 
+_tmux_control = TmuxControl()
 
-def tmux_list_sessions() -> List[str]:
-    import shutil
 
-    if not shutil.which("tmux"):
+async def tmux_list_sessions() -> List[str]:
+    tmux = _tmux_path()
+    if not tmux:
         return []
-    result = subprocess.run(
-        ["tmux", "list-sessions", "-F", "#S"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
+    reply = await _tmux_control.call(["list-sessions", "-F", "#S"])
+    if reply is not None:
+        ok, lines = reply
+        return [line.strip() for line in lines if line.strip()] if ok else []
+    code, stdout = await _spawn_capture([tmux, "list-sessions", "-F", "#S"])
+    if code != 0:
         return []
-    return [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
+    # Split the raw bytes and only decode the names themselves.
+    names = (line.strip() for line in stdout.split(b"\n"))
+    return [name.decode("utf-8", "replace") for name in names if name]
 
 
-def sessions_for_worktree(repo: str, worktree: str, tmux_sessions: List[str]) -> List[str]:
-    prefix = f"{repo}_{worktree}"
-    sessions = []
+async def _spawn_capture(argv: List[str]) -> Tuple[int, bytes]:
+    # For the tmux one-shots: posix_spawn skips Popen's fork_exec setup and
+    # close_fds sweep. Our own fds are close-on-exec anyway, and stderr is dropped.
+    loop = asyncio.get_running_loop()
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawnp(
+            argv[0],
+            argv,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ],
+        )
+    except OSError:
+        os.close(read_fd)
+        return 127, b""
+    finally:
+        os.close(write_fd)
+    # The child is only reaped, and its pid freed for reuse, under reap_lock;
+    # a kill checks under the same lock that it hasn't been reaped yet.
+    reap_lock = threading.Lock()
+    exited = False
+
+    def reap() -> int:
+        nonlocal exited
+        if hasattr(os, "waitid"):
+            # WNOWAIT leaves the exited child a zombie, so its pid stays reserved.
+            os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+        delay = 0.001
+        while True:
+            with reap_lock:
+                done, status = os.waitpid(pid, os.WNOHANG)
+                if done:
+                    exited = True
+                    return os.waitstatus_to_exitcode(status)
+            # Only reached without waitid (macOS): poll, so that the reap
+            # itself still happens under the lock.
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    reaped = asyncio.ensure_future(asyncio.to_thread(reap))
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(read_fd, "rb", 0)
+    )
+    try:
+        output = await reader.read()
+        code = await asyncio.shield(reaped)
+    except asyncio.CancelledError:
+        with reap_lock:
+            if not exited:
+                os.kill(pid, signal.SIGKILL)
+        raise
+    finally:
+        transport.close()
+    return code, output
+
+
+@functools.lru_cache(maxsize=4)
+def _session_pattern(prefixes: Tuple[str, ...]) -> "re.Pattern[str]":
+    # Alternatives are tried in order, so longer prefixes must come first.
+    return re.compile("(" + "|".join(map(re.escape, prefixes)) + ")(?:_(.*))?", re.S)
+
+
+def index_tmux_sessions(
+    tmux_sessions: Iterable[str], projects: Iterable[Project]
+) -> Dict[Tuple[str, Optional[str]], List[str]]:
+    # tmux names are "<repo>_<worktree>[_<sub>]" or "<repo>[_<sub>]", and repo
+    # and worktree names may contain "_" themselves, so match each name once
+    # against the known prefixes instead of splitting it. The longest prefix
+    # wins. Keys are (repo, worktree), with worktree None for plain repos.
+    owners: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+    for project in projects:
+        if project.is_worktree_repo:
+            for worktree in project.worktrees:
+                owners.setdefault(f"{project.name}_{worktree}", []).append((project.name, worktree))
+        else:
+            owners.setdefault(project.name, []).append((project.name, None))
+    index: Dict[Tuple[str, Optional[str]], List[str]] = {}
+    if not owners:
+        return index
+    pattern = _session_pattern(tuple(sorted(owners, key=len, reverse=True)))
     for name in tmux_sessions:
-        if not name.startswith(prefix):
+        match = pattern.fullmatch(name)
+        if not match:
             continue
-        if name == prefix:
-            sessions.append(f"{repo}/{worktree}")
-        elif name.startswith(prefix + "_"):
-            sub = name[len(prefix) + 1 :]
-            sessions.append(f"{repo}/{worktree}/{sub}")
-    return sorted(set(sessions))
-
-
-def sessions_for_repo(repo: str, tmux_sessions: List[str]) -> List[str]:
-    sessions = []
-    for name in tmux_sessions:
-        if name == repo:
-            sessions.append(repo)
-        elif name.startswith(repo + "_"):
-            sub = name[len(repo) + 1 :]
-            sessions.append(f"{repo}/{sub}")
-    return sorted(set(sessions))
+        prefix, sub = match.groups()
+        for repo, worktree in owners[prefix]:
+            base = repo if worktree is None else f"{repo}/{worktree}"
+            session = base if sub is None else f"{base}/{sub}"
+            index.setdefault((repo, worktree), []).append(sys.intern(session))
+    for sessions in index.values():
+        sessions.sort()
+    return index
 
 
 class PromptScreen(ModalScreen[str]):
@@ -235,81 +607,142 @@ class CashewApp(App):
         ("c", "cleanup", "Cleanup worktree"),
     ]
 
+    _CLEANUP_KEYS = frozenset({"y", "n"})
+    # How long a node's rendered status is reused: running sessions always
+    # re-poll, stopped ones rarely, and without tmux only on refresh.
+    _STATUS_TTLS = {"hot": 0.0, "warm": 2.5, "cold": 30.0, "frozen": float("inf")}
+
     def __init__(self) -> None:
         super().__init__()
         self.projects: List[Project] = []
+        self._project_index: Dict[str, Project] = {}
+        self._tree_entries: List[TreeEntry] = []
         self.current_node: Optional[NodeData] = None
         self.pending_cleanup: Optional[NodeData] = None
         self.modal_open = False
+        self._tmux_snapshot: Optional[Set[str]] = None
+        self._tmux_snapshot_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_timer: Optional[Timer] = None
+        self._refresh_token = 0
+        self._projects_cache = ProjectCache()
+        self._last_status = ""
+        self._loading_timer: Optional[Timer] = None
+        self._batch_status = True
+        self._status_cache: Dict[NodeData, Tuple[float, str]] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
         with Horizontal(id="layout"):
             with Vertical(id="projects"):
                 yield Label("Projects", id="projects-title")
-                yield Tree("Projects", id="project-tree")
+                self._tree = Tree("Projects", id="project-tree")
+                yield self._tree
             with Vertical(id="status"):
                 yield Label("Status", id="status-title")
-                yield RichLog(id="status-log", highlight=False)
+                self._status_log = RichLog(id="status-log", highlight=False)
+                yield self._status_log
         yield Footer()
 
     async def on_mount(self) -> None:
+        await _dev_server.start()
+        await _tmux_control.start()
         await self.action_refresh()
-        tree = self.query_one("#project-tree", Tree)
-        tree.focus()
+        self._tree.focus()
+
+    async def on_unmount(self) -> None:
+        await _dev_server.stop()
+        await _tmux_control.stop()
+
+    async def _tmux_sessions_snapshot(self, max_age: float = 0.5) -> Set[str]:
+        now = time.monotonic()
+        if self._tmux_snapshot is None or now - self._tmux_snapshot_at > max_age:
+            self._tmux_snapshot = set(await tmux_list_sessions())
+            self._tmux_snapshot_at = now
+        return self._tmux_snapshot
+
+    def _invalidate_tmux_snapshot(self) -> None:
+        self._tmux_snapshot = None
 
     async def action_refresh(self) -> None:
-        self.projects = load_projects()
-        tree = self.query_one("#project-tree", Tree)
-        tree.root.remove_children()
-        tree.root.label = "Projects"
-        if not self.projects:
-            tree.root.add("(no projects found)")
-            self.current_node = None
+        self.projects = load_projects(self._projects_cache)
+        self._project_index = {project.name: project for project in self.projects}
+        self._invalidate_tmux_snapshot()
+        self._status_cache.clear()
+        self._tree_entries = self._build_entries(self.projects, await self._tmux_sessions_snapshot())
+        if not self._show_entries(self._tree_entries, "(no projects found)"):
             self._set_status("No projects found.")
             return
-        tmux_sessions = tmux_list_sessions()
-        for project in self.projects:
-            node = tree.root.add(project.name, expand=True, data=NodeData("project", project.name))
+        await self._refresh_status()
+
+    def _build_entries(self, projects: List[Project], tmux_sessions: Set[str]) -> List[TreeEntry]:
+        session_index = index_tmux_sessions(tmux_sessions, projects)
+        desired: List[TreeEntry] = []
+        for project in projects:
+            entry = TreeEntry(project.name, NodeData("project", project.name), expand=True)
             if project.is_worktree_repo:
                 for worktree in project.worktrees:
-                    wt_node = node.add(worktree, data=NodeData("worktree", project.name, worktree))
-                    sessions = sessions_for_worktree(project.name, worktree, tmux_sessions)
+                    wt_entry = TreeEntry(worktree, NodeData("worktree", project.name, worktree))
+                    root_session = f"{project.name}/{worktree}"
+                    sessions = session_index.get((project.name, worktree), [])
                     for session in sessions:
-                        label = session.split("/")[-1]
-                        if session == f"{project.name}/{worktree}":
-                            label = "root"
-                        wt_node.add(
-                            label,
-                            data=NodeData(
-                                "session",
-                                project.name,
-                                worktree,
-                                session=session,
-                                sub=None if label == "root" else label,
-                            ),
+                        label = "root" if session == root_session else sys.intern(session.rsplit("/", 1)[-1])
+                        wt_entry.children.append(
+                            TreeEntry(
+                                label,
+                                NodeData(
+                                    "session",
+                                    project.name,
+                                    worktree,
+                                    session=session,
+                                    sub=None if label == "root" else label,
+                                ),
+                            )
                         )
-                    wt_node.add(
-                        "new...",
-                        data=NodeData("new-session", project.name, worktree),
+                    wt_entry.children.append(
+                        TreeEntry("new...", NodeData("new-session", project.name, worktree)),
                     )
+                    entry.children.append(wt_entry)
             else:
-                sessions = sessions_for_repo(project.name, tmux_sessions)
+                sessions = session_index.get((project.name, None), [])
                 for session in sessions:
-                    label = session.split("/")[-1]
-                    node.add(
-                        label,
-                        data=NodeData("session", project.name, None, session=session, sub=label),
+                    label = sys.intern(session.rsplit("/", 1)[-1])
+                    entry.children.append(
+                        TreeEntry(label, NodeData("session", project.name, None, session=session, sub=label))
                     )
-        tree.root.expand()
+            desired.append(entry)
+        return desired
+
+    def _show_entries(self, desired: List[TreeEntry], empty_label: str) -> bool:
+        tree = self._tree
+        tree.root.label = "Projects"
+        self._sync_children(tree.root, desired)
         first = tree.root.children[0] if tree.root.children else None
-        if first and isinstance(first.data, NodeData):
-            self.current_node = first.data
-            tree.cursor_line = first.line
-        else:
+        if not first:
+            tree.root.add(empty_label)
             self.current_node = None
-            tree.cursor_line = 0
-        await self._refresh_status()
+            return False
+        tree.root.expand()
+        self.current_node = first.data
+        tree.cursor_line = first.line
+        return True
+
+    def _sync_children(self, parent: TreeNode, desired: List[TreeEntry]) -> None:
+        # Patch the existing nodes rather than rebuilding, so unchanged
+        # subtrees (and their expanded state) are left alone. Both sides
+        # come from sorted names, so kept nodes are already in order.
+        wanted = {entry.data for entry in desired}
+        existing: Dict[NodeData, TreeNode] = {}
+        for child in list(parent.children):
+            if child.data in wanted:
+                existing[child.data] = child
+            else:
+                child.remove()
+        for index, entry in enumerate(desired):
+            node = existing.get(entry.data)
+            if node is None:
+                node = parent.add(entry.label, data=entry.data, before=index, expand=entry.expand)
+            self._sync_children(node, entry.children)
 
     async def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
         if self.modal_open:
@@ -317,14 +750,25 @@ class CashewApp(App):
         node = event.node
         if node and isinstance(node.data, NodeData):
             self.current_node = node.data
-            await self._refresh_status()
+            self._schedule_refresh()
+
+    def _schedule_refresh(self, delay: float = 0.15) -> None:
+        if self._refresh_timer:
+            self._refresh_timer.stop()
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_timer = self.set_timer(delay, self._start_refresh)
+
+    def _start_refresh(self) -> None:
+        self._refresh_timer = None
+        self._refresh_task = asyncio.create_task(self._refresh_status())
 
     async def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         node = event.node
         if not node or not isinstance(node.data, NodeData):
             return
         self.current_node = node.data
-        await self._handle_selection()
+        self.run_worker(self._handle_selection(), group="actions")
 
     async def _prompt(self, title: str, placeholder: str, confirm: str) -> str:
         self.modal_open = True
@@ -352,7 +796,7 @@ class CashewApp(App):
             if not session:
                 return
             cwd = project.path / node.worktree if node.worktree else project.path
-            self._open_session(session, cwd, project.is_worktree_repo, node.sub)
+            await self._open_session(session, cwd, project.is_worktree_repo, node.sub)
         elif node.kind == "new-session":
             project = self._project_for_node(node)
             if not project:
@@ -363,8 +807,17 @@ class CashewApp(App):
                 return
             cwd = project.path / node.worktree if node.worktree else project.path
             session = f"{node.repo}/{node.worktree}/{sub}"
-            self._open_session(session, cwd, project.is_worktree_repo, sub)
+            await self._open_session(session, cwd, project.is_worktree_repo, sub)
+
+    # Actions run as workers: Textual handles App messages one at a time, so
+    # awaiting a slow `dev send-pi` in the handler would hold up every key.
+    async def _run_action(self, cmd: List[str]) -> str:
+        output = await run_command_async(cmd)
+        # Sends and cleanups change what the status pane should show.
+        self._status_cache.clear()
+        return output
 
+    @work(group="actions")
     async def action_pm_message(self) -> None:
         if not self.current_node:
             return
@@ -376,9 +829,10 @@ class CashewApp(App):
         if not message:
             return
         session = pm_session(project.name, project.is_worktree_repo)
-        output = run_command(["dev", "send", session, message, "Enter"])
+        output = await self._run_action(["dev", "send", session, message, "Enter"])
         self._set_status(output or f"Sent to {session}")
 
+    @work(group="actions")
     async def action_pm_review_loop(self) -> None:
         if not self.current_node:
             return
@@ -387,9 +841,10 @@ class CashewApp(App):
             return
         session = pm_session(project.name, project.is_worktree_repo)
         message = "Run `dev review-loop` and follow it exactly (run `bash sleep 300` in the foreground; no scripts/nohup/background loops)."
-        output = run_command(["dev", "send", session, message, "Enter"])
+        output = await self._run_action(["dev", "send", session, message, "Enter"])
         self._set_status(output or f"Sent review loop to {session}")
 
+    @work(group="actions")
     async def action_pm_request_review(self) -> None:
         if not self.current_node:
             return
@@ -406,9 +861,10 @@ class CashewApp(App):
             return
         session = pm_session(project.name, project.is_worktree_repo)
         message = f"Run the code-review skill for {project.name}/{worktree}. Report back before merge."
-        output = run_command(["dev", "send", session, message, "Enter"])
+        output = await self._run_action(["dev", "send", session, message, "Enter"])
         self._set_status(output or f"Sent review request to {session}")
 
+    @work(group="actions")
     async def action_worktree_message(self) -> None:
         if not self.current_node or self.current_node.kind not in {"worktree", "session", "new-session"}:
             self._set_status("Select a worktree to message its agent.")
@@ -421,7 +877,7 @@ class CashewApp(App):
         message = normalize_message(message or "")
         if not message:
             return
-        output = run_command(["dev", "send-pi", session, message])
+        output = await self._run_action(["dev", "send-pi", session, message])
         self._set_status(output or f"Queued for {session}")
 
     async def action_cleanup(self) -> None:
@@ -431,36 +887,37 @@ class CashewApp(App):
         self.pending_cleanup = self.current_node
         self._set_status(f"Cleanup {self.current_node.repo}/{self.current_node.worktree}? Press 'y' to confirm, 'n' to cancel.")
 
+    async def _cleanup(self, session: str) -> None:
+        output = await self._run_action(["dev", "cleanup", session])
+        self._set_status(output or f"Cleaned {session}")
+        await self.action_refresh()
+
     async def on_key(self, event) -> None:
         if isinstance(self.focused, Input):
             return
 
-        if self.pending_cleanup and event.key in {"y", "n"}:
-            if event.key == "y":
+        key = event.key
+        if self.pending_cleanup and key in self._CLEANUP_KEYS:
+            if key == "y":
                 session = f"{self.pending_cleanup.repo}/{self.pending_cleanup.worktree}"
-                output = run_command(["dev", "cleanup", session])
-                self._set_status(output or f"Cleaned {session}")
-                await self.action_refresh()
+                self.run_worker(self._cleanup(session), group="actions")
             else:
                 self._set_status("Cleanup canceled.")
             self.pending_cleanup = None
             event.stop()
             return
 
-        if event.key == "/" and not self.modal_open:
-            await self._filter_projects()
+        if key == "/" and not self.modal_open:
+            self.run_worker(self._filter_projects(), group="actions")
             event.stop()
             return
 
-        if event.key == "right":
-            await self._default_attach()
+        if key == "right":
+            self.run_worker(self._default_attach(), group="actions")
             event.stop()
 
     def _project_for_node(self, node: NodeData) -> Optional[Project]:
-        for project in self.projects:
-            if project.name == node.repo:
-                return project
-        return None
+        return self._project_index.get(node.repo)
 
     async def _default_attach(self) -> None:
         if not self.current_node:
@@ -477,14 +934,14 @@ class CashewApp(App):
                 return
             session = pm_session(project.name, project.is_worktree_repo)
             cwd = project.path / "main" if project.is_worktree_repo else project.path
-            self._open_session(session, cwd, project.is_worktree_repo, None)
+            await self._open_session(session, cwd, project.is_worktree_repo, None)
         elif self.current_node.kind == "worktree":
             repo = self.current_node.repo
             worktree = self.current_node.worktree or ""
             project = self._project_for_node(self.current_node)
             project_path = project.path if project else (projects_dir() / repo)
             cwd = project_path / worktree
-            self._open_session(f"{repo}/{worktree}/pi", cwd, True, "pi")
+            await self._open_session(f"{repo}/{worktree}/pi", cwd, True, "pi")
 
     async def _filter_projects(self) -> None:
         query = await self._prompt("Filter projects", "type to filter", "apply")
@@ -492,61 +949,24 @@ class CashewApp(App):
         if not query:
             await self.action_refresh()
             return
-        tree = self.query_one("#project-tree", Tree)
-        tree.root.remove_children()
-        filtered = []
-        for project in self.projects:
-            if query in project.name.lower():
-                filtered.append(project)
+
+        # Filter the entries from the last refresh: kept nodes are matched by
+        # value and left in place, the rest are pruned, and nothing is re-queried.
+        matches = []
+        for entry in self._tree_entries:
+            if query in entry.label.lower():
+                matches.append(entry)
                 continue
-            for wt in project.worktrees:
-                if query in wt.lower():
-                    filtered.append(project)
-                    break
-        if not filtered:
-            tree.root.add("(no matches)")
-            self.current_node = None
+            worktrees = [
+                child for child in entry.children if child.data.kind == "worktree" and query in child.label.lower()
+            ]
+            if worktrees:
+                matches.append(TreeEntry(entry.label, entry.data, entry.expand, worktrees))
+
+        if not self._show_entries(matches, "(no matches)"):
             self._set_status("No matches.")
             return
-        tmux_sessions = tmux_list_sessions()
-        for project in filtered:
-            node = tree.root.add(project.name, expand=True, data=NodeData("project", project.name))
-            if project.is_worktree_repo:
-                for worktree in project.worktrees:
-                    if query in project.name.lower() or query in worktree.lower():
-                        wt_node = node.add(worktree, data=NodeData("worktree", project.name, worktree))
-                        sessions = sessions_for_worktree(project.name, worktree, tmux_sessions)
-                        for session in sessions:
-                            label = session.split("/")[-1]
-                            if session == f"{project.name}/{worktree}":
-                                label = "root"
-                            wt_node.add(
-                                label,
-                                data=NodeData(
-                                    "session",
-                                    project.name,
-                                    worktree,
-                                    session=session,
-                                    sub=None if label == "root" else label,
-                                ),
-                            )
-                        wt_node.add("new...", data=NodeData("new-session", project.name, worktree))
-            else:
-                sessions = sessions_for_repo(project.name, tmux_sessions)
-                for session in sessions:
-                    label = session.split("/")[-1]
-                    node.add(
-                        label,
-                        data=NodeData("session", project.name, None, session=session, sub=label),
-                    )
-        tree.root.expand()
-        first = tree.root.children[0] if tree.root.children else None
-        if first and isinstance(first.data, NodeData):
-            self.current_node = first.data
-            tree.cursor_line = first.line
-            await self._refresh_status()
-        else:
-            self._set_status("Select a project or worktree.")
+        await self._refresh_status()
 
     def _auto_command(self, is_worktree_repo: bool, sub: Optional[str]) -> List[str]:
         if sub == "pi":
@@ -557,35 +977,29 @@ class CashewApp(App):
             return ["pi"]
         return ["claude", "--dangerously-skip-permissions"]
 
-    def _open_session(self, session: str, cwd: Path, is_worktree_repo: bool, sub: Optional[str]) -> None:
-        import os
-        import shlex
-        import shutil
-
-        if os.environ.get("TMUX") and shutil.which("tmux"):
+    async def _open_session(self, session: str, cwd: Path, is_worktree_repo: bool, sub: Optional[str]) -> None:
+        tmux = _tmux_path()
+        if os.environ.get("TMUX") and tmux:
             command = self._auto_command(is_worktree_repo, sub)
             tmux_name = tmux_session_name(session)
-            cmd_parts = ["tmux", "new-session", "-A", "-s", tmux_name, "-c", str(cwd)]
-            cmd_parts += command
-            tmux_inner = " ".join(shlex.quote(part) for part in cmd_parts)
-            tmux_cmd = f"bash -lc 'unset TMUX; exec {tmux_inner}'"
+            # Passed as separate argv entries, tmux execs this directly instead
+            # of going through a (login) shell; env drops TMUX so the nested
+            # client is allowed to attach.
+            tmux_cmd = ["env", "-u", "TMUX", "tmux", "new-session", "-A", "-s", tmux_name, "-c", str(cwd)]
+            tmux_cmd += command
             window_name = f"cashew-{tmux_name}"
-            if tmux_window_exists(window_name):
-                subprocess.run(["tmux", "select-window", "-t", window_name], check=False)
-            else:
-                subprocess.run(
-                    ["tmux", "new-window", "-d", "-n", window_name, tmux_cmd],
-                    check=False,
-                )
-                subprocess.run(["tmux", "select-window", "-t", window_name], check=False)
-            subprocess.run(
-                [
-                    "tmux",
-                    "display-message",
-                    f"Opened {window_name}. Use prefix+w or `cashew` to return to the TUI.",
-                ],
-                check=False,
-            )
+            # Chain the notice onto the same tmux client; it only runs if the
+            # window command before it succeeded.
+            notify = [
+                ";",
+                "display-message",
+                f"Opened {window_name}. Use prefix+w or `cashew` to return to the TUI.",
+            ]
+            selected, _ = await _spawn_capture([tmux, "select-window", "-t", f"={window_name}", *notify])
+            if selected != 0:
+                await _spawn_capture([tmux, "new-window", "-n", window_name, "-c", str(cwd), *tmux_cmd, *notify])
+                # The new window starts a tmux session the snapshot doesn't know about.
+                self._invalidate_tmux_snapshot()
             self._set_status(
                 f"Opened {window_name}. Use tmux prefix+w or `cashew` to return to the TUI."
             )
@@ -594,95 +1008,167 @@ class CashewApp(App):
         os.execvp("dev", ["dev", session])
 
     def _set_status(self, text: str) -> None:
-        log = self.query_one("#status-log", RichLog)
-        log.clear()
-        log.write(text)
+        self._stop_loading()
+        if text == self._last_status:
+            return
+        if self._last_status and text.startswith(self._last_status + "\n"):
+            # Only new lines at the end; keep the scrollback and write the tail.
+            self._append_status(text[len(self._last_status) + 1 :])
+            return
+        self._last_status = text
+        self._status_log.clear()
+        self._status_log.write(text)
+
+    def _append_status(self, text: str) -> None:
+        self._last_status += "\n" + text
+        self._status_log.write(text)
+
+    def _stop_loading(self) -> None:
+        if self._loading_timer:
+            self._loading_timer.stop()
+            self._loading_timer = None
+
+    def _show_loading(self) -> None:
+        # The timer callback can already be queued when a result lands and
+        # stops the timer; a cleared handle means the result won.
+        if self._loading_timer:
+            self._set_status("Loading...")
+
+    async def _status_tier(self, node: NodeData) -> str:
+        if not _tmux_path():
+            return "frozen"
+        if node.kind == "project":
+            return "warm"
+        session = self._session_from_node(node) or worktree_session(node.repo, node.worktree or "")
+        return "hot" if tmux_session_exists(session, await self._tmux_sessions_snapshot()) else "cold"
 
     async def _refresh_status(self) -> None:
         if not self.current_node:
             self._set_status("Select a project or worktree.")
             return
-        self._set_status("Loading...")
+        node = self.current_node
+        # Newer refreshes supersede this one; its result is then only cached.
+        self._refresh_token += 1
+        token = self._refresh_token
+        collectors = {
+            "project": self._project_status,
+            "worktree": self._worktree_status,
+            "session": self._session_status,
+            "new-session": self._new_session_status,
+        }
+        collector = collectors.get(node.kind)
+        if not collector:
+            return
+        cached = self._status_cache.get(node)
+        if cached and time.monotonic() - cached[0] < self._STATUS_TTLS[await self._status_tier(node)]:
+            # _status_tier may have awaited a tmux query; a newer refresh wins.
+            if token == self._refresh_token:
+                self._set_status(cached[1])
+            return
+        # Only show the placeholder if the collectors are slow; fast results
+        # replace the current status in a single redraw.
+        self._stop_loading()
+        self._loading_timer = self.set_timer(0.1, self._show_loading)
+        parts: List[str] = []
+        # Sections are written as they arrive. The log is only cleared once the
+        # streamed text stops matching what is already on screen, so an
+        # unchanged status is never redrawn.
+        drawing = False
         try:
-            if self.current_node.kind == "project":
-                await self._refresh_project_status(self.current_node)
-            elif self.current_node.kind == "worktree":
-                await self._refresh_worktree_status(self.current_node)
-            elif self.current_node.kind == "session":
-                await self._refresh_session_status(self.current_node)
-            elif self.current_node.kind == "new-session":
-                await self._refresh_new_session_status(self.current_node)
+            async for part in collector(node):
+                parts.append(part)
+                if token != self._refresh_token:
+                    continue
+                if drawing:
+                    self._append_status(part)
+                    continue
+                text = "\n".join(parts)
+                if self._last_status.startswith(text):
+                    self._stop_loading()
+                else:
+                    self._set_status(text)
+                    drawing = True
         except Exception as exc:
-            self._set_status(f"Error: {exc}")
+            if token == self._refresh_token:
+                self._set_status(f"Error: {exc}")
+            return
+        text = "\n".join(parts)
+        self._status_cache[node] = (time.monotonic(), text)
+        if token == self._refresh_token:
+            self._set_status(text)
 
-    async def _refresh_project_status(self, node: NodeData) -> None:
+    async def _project_status(self, node: NodeData) -> AsyncIterator[str]:
         project = self._project_for_node(node)
         if not project:
-            self._set_status("Project not found.")
+            yield "Project not found."
             return
         session = pm_session(project.name, project.is_worktree_repo)
+        yield f"PM session: {session}\n"
+        if not project.is_worktree_repo:
+            yield "(non-worktree repo)"
+            return
+        parts = ["Worktrees:"]
+        sessions = [worktree_session(project.name, wt) for wt in project.worktrees]
+        for wt, (last_msg, req) in zip(project.worktrees, await self._worktree_summaries(sessions)):
+            parts.append(f"- {wt}: {summarize_line(last_msg)} | req: {summarize_line(req)}")
+        yield "\n".join(parts)
+
+    async def _worktree_summaries(self, sessions: List[str]) -> List[Tuple[str, str]]:
+        if self._batch_status and sessions:
+            batch = await batch_status(sessions)
+            if batch is not None:
+                entries = [batch.get(session) or {} for session in sessions]
+                return [(entry.get("last_msg", ""), entry.get("requirements", "")) for entry in entries]
+            # Fall back for this refresh. Only stop trying if dev itself is
+            # missing or predates batch-status, not on a one-off failure.
+            code, usage = await run_command_result(["dev", "help"])
+            if code == 127 or "batch-status" not in usage:
+                self._batch_status = False
+        commands = []
+        for session in sessions:
+            commands.append(["dev", "pi-status", session, "--messages", "1"])
+            commands.append(["dev", "requirements", session])
+        outputs = await gather_commands(commands)
+        return list(zip(outputs[0::2], outputs[1::2]))
+
+    async def _pi_status_sections(self, session: str) -> AsyncIterator[str]:
+        # All three run concurrently; each section is handed out, in order, as
+        # soon as its command has finished.
+        tasks = [
+            asyncio.ensure_future(run_command_async(cmd))
+            for cmd in (
+                ["dev", "pi-status", session, "--messages", "1"],
+                ["dev", "requirements", session],
+                ["dev", "queue-status", session, "-m"],
+            )
+        ]
+        try:
+            yield f"== last message ==\n{await tasks[0]}\n"
+            yield f"== requirements ==\n{await tasks[1]}\n"
+            yield f"== queue ==\n{await tasks[2]}"
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        def collect() -> str:
-            parts = [f"PM session: {session}", ""]
-            if project.is_worktree_repo:
-                parts.append("Worktrees:")
-                for wt in project.worktrees:
-                    wt_session = worktree_session(project.name, wt)
-                    last_msg = summarize_line(run_command(["dev", "pi-status", wt_session, "--messages", "1"]))
-                    req = summarize_line(run_command(["dev", "requirements", wt_session]))
-                    parts.append(f"- {wt}: {last_msg} | req: {req}")
-            else:
-                parts.append("(non-worktree repo)")
-            return "\n".join(parts)
-
-        text = await asyncio.to_thread(collect)
-        self._set_status(text)
-
-    async def _refresh_worktree_status(self, node: NodeData) -> None:
+    async def _worktree_status(self, node: NodeData) -> AsyncIterator[str]:
+        yield f"Worktree: {node.repo}/{node.worktree}\n"
         session = worktree_session(node.repo, node.worktree or "")
+        async for part in self._pi_status_sections(session):
+            yield part
 
-        def collect() -> str:
-            parts = []
-            parts.append(f"Worktree: {node.repo}/{node.worktree}")
-            parts.append("")
-            parts.append("== last message ==")
-            parts.append(run_command(["dev", "pi-status", session, "--messages", "1"]))
-            parts.append("")
-            parts.append("== requirements ==")
-            parts.append(run_command(["dev", "requirements", session]))
-            parts.append("")
-            parts.append("== queue ==")
-            parts.append(run_command(["dev", "queue-status", session, "-m"]))
-            return "\n".join(parts)
-
-        text = await asyncio.to_thread(collect)
-        self._set_status(text)
-
-    async def _refresh_session_status(self, node: NodeData) -> None:
+    async def _session_status(self, node: NodeData) -> AsyncIterator[str]:
         session = self._session_from_node(node)
         if not session:
-            self._set_status("Session not found.")
-            return
-        running = "yes" if tmux_session_exists(session) else "no"
-
-        def collect() -> str:
-            parts = [f"Session: {session}", f"Running: {running}", ""]
-            if session.endswith("/pi"):
-                parts.append("== last message ==")
-                parts.append(run_command(["dev", "pi-status", session, "--messages", "1"]))
-                parts.append("")
-                parts.append("== requirements ==")
-                parts.append(run_command(["dev", "requirements", session]))
-                parts.append("")
-                parts.append("== queue ==")
-                parts.append(run_command(["dev", "queue-status", session, "-m"]))
-            return "\n".join(parts)
-
-        text = await asyncio.to_thread(collect)
-        self._set_status(text)
-
-    async def _refresh_new_session_status(self, node: NodeData) -> None:
-        self._set_status(
+            yield "Session not found."
+            return
+        running = "yes" if tmux_session_exists(session, await self._tmux_sessions_snapshot()) else "no"
+        yield f"Session: {session}\nRunning: {running}\n"
+        if session.endswith("/pi"):
+            async for part in self._pi_status_sections(session):
+                yield part
+
+    async def _new_session_status(self, node: NodeData) -> AsyncIterator[str]:
+        yield (
             "New session for "
             f"{node.repo}/{node.worktree}.\n"
             "Press Enter to name the sub-session (pi/claude/etc)."